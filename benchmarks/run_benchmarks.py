@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Offline Scraper Benchmarks
+Serves recorded and synthetic snapshots of each source from a local HTTP
+server and runs every source in sources/ through Engine.run (fetch, readiness
+check, fingerprint, parse, RSS), so performance can be measured without
+hitting the live sites. Each case is also timed with an unchanged listing.
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # compare with baseline
+    python benchmarks/run_benchmarks.py --save-baseline  # record a new baseline
+    python benchmarks/run_benchmarks.py --mode requests --source wire --items 5000
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+SOURCES_DIR = os.path.join(REPO_DIR, 'sources')
+
+# Let spawned workers import the scrapers
+sys.path.insert(0, REPO_DIR)
+
+SOURCES = sorted(f[:-5] for f in os.listdir(SOURCES_DIR) if f.endswith('.json'))
+MODES = ['requests', 'browser']
+
+# Small synthetic page size, roughly what the live listings carry
+SMALL_ITEMS = 50
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+def page(body):
+    """Wrap listing markup in a minimal HTML document"""
+    return f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>Snapshot</title></head><body>{body}</body></html>'
+
+def synth_trump(n):
+    """donaldjtrump.com/news style listing with n articles"""
+    return page(''.join(
+        f'<div class="news-item"><p>January {i % 28 + 1}, 2025</p>'
+        f'<a href="/news/campaign-update-{i}">Campaign update number {i} from the trail</a></div>'
+        for i in range(n)
+    ))
+
+def synth_whitehouse(n):
+    """whitehouse.gov/news style post template listing with n posts"""
+    return page('<ul class="wp-block-post-template">' + ''.join(
+        f'<li class="wp-block-post"><div class="wp-block-whitehouse-post-template">'
+        f'<div class="wp-block-whitehouse-post-template__content">'
+        f'<h2 class="wp-block-post-title"><a href="https://www.whitehouse.gov/articles/2025/01/statement-{i}/">'
+        f'Statement {i} on Presidential Actions</a></h2>'
+        f'<div class="wp-block-post-date"><time datetime="2025-01-15T12:00:00-05:00">January 15, 2025</time></div>'
+        f'</div></div></li>'
+        for i in range(n)
+    ) + '</ul>')
+
+def synth_wire(n):
+    """whitehouse.gov/wire style page: site navigation plus n external links"""
+    nav = ''.join(
+        f'<a href="https://www.whitehouse.gov{path}">{path.strip("/").title()}</a>'
+        for path in ['/about/', '/issues/', '/news/', '/wire/', '/contact/']
+    )
+    return page(f'<nav>{nav}</nav>' + ''.join(
+        f'<div class="wire-item"><a href="https://news.example.com/politics/story-{i}">'
+        f'Aggregated headline number {i} about the administration this week</a></div>'
+        for i in range(n)
+    ))
+
+def synth_infowars(n):
+    """infowars.com/breaking-news style listing with n article cards"""
+    return page(''.join(
+        f'<article class="post article-card"><h2 class="title"><a href="/posts/breaking-story-{i}">'
+        f'Breaking story {i}</a></h2><time datetime="2025-01-15T12:00:00Z">January 15, 2025</time>'
+        f'<p class="excerpt">Excerpt for breaking story {i}, long enough to count as a description.</p></article>'
+        for i in range(n)
+    ))
+
+SYNTHETIC = {
+    'trump': synth_trump,
+    'whitehouse': synth_whitehouse,
+    'wire': synth_wire,
+    'infowars': synth_infowars,
+}
+
+def build_pages(sources, large_items):
+    """Return {path: html} for every snapshot of the selected sources"""
+    pages = {}
+    for source in sources:
+        recorded = os.path.join(FIXTURE_DIR, f'{source}_news.html')
+        if os.path.exists(recorded):
+            with open(recorded, 'r', encoding='utf-8') as f:
+                pages[f'/{source}/recorded'] = f.read()
+        # Sources without a synthetic generator only run on their recordings
+        if source in SYNTHETIC:
+            for n in sorted({SMALL_ITEMS, large_items}):
+                pages[f'/{source}/synthetic-{n}'] = SYNTHETIC[source](n)
+    return pages
+
+
+# ---------------------------------------------------------------------------
+# Local stand-in site
+# ---------------------------------------------------------------------------
+
+def start_server(pages):
+    """Serve pages from memory on a free local port, returns (server, base_url)"""
+    encoded = {path: html.encode('utf-8') for path, html in pages.items()}
+
+    class SnapshotHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = encoded.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SnapshotHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+
+# ---------------------------------------------------------------------------
+# Pipelines (run inside a fresh worker process)
+# ---------------------------------------------------------------------------
+
+def load_source(source, mode, url):
+    """Compile a source and point it at a snapshot, fetched with `mode`"""
+    from scrape_engine import load_sources
+    from selector_cascade import SelectorStats
+
+    # Stats go to the worker's temp dir so real state isn't touched
+    stats = SelectorStats(os.path.join('state', 'selector_stats.json'))
+    compiled = load_sources([source], stats)[0]
+    compiled.url = url
+    compiled.fetch = mode
+    # Snapshots are static: keep the readiness check but don't wait for it
+    compiled.wait = 0
+    return compiled
+
+def count_items(compiled, counts):
+    """Record how many articles each extract() returns"""
+    extract = compiled.extract
+
+    def counted(soup):
+        articles = extract(soup)
+        counts.append(len(articles))
+        return articles
+    compiled.extract = counted
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def run_case(source, mode, url, runs, unchanged=False):
+    """
+    Time `runs` Engine.run() calls of one source/mode against one snapshot.
+    With unchanged=True the listing is already fingerprinted, so every timed
+    run measures the unchanged short-circuit; otherwise the feed is removed
+    before each run so it is parsed and written in full.
+    """
+    from scrape_engine import Engine
+
+    cwd = os.getcwd()
+    log = io.StringIO()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            with contextlib.redirect_stdout(log):
+                compiled = load_source(source, mode, url)
+                counts = []
+                count_items(compiled, counts)
+                engine = Engine()
+                try:
+                    # Warm-up run, not counted (imports, connection setup, browser caches)
+                    if not engine.run(compiled):
+                        raise RuntimeError(log.getvalue().strip().splitlines()[-1])
+                    counts.clear()
+
+                    latencies = []
+                    for _ in range(runs):
+                        if not unchanged:
+                            os.remove(compiled.output)
+                        start = time.perf_counter()
+                        ok = engine.run(compiled)
+                        latencies.append(time.perf_counter() - start)
+                        if not ok:
+                            raise RuntimeError(log.getvalue().strip().splitlines()[-1])
+                finally:
+                    engine.close()
+        except Exception as e:
+            return {'error': f"{type(e).__name__}: {e}"}
+        finally:
+            os.chdir(cwd)
+
+    return {
+        'latencies': latencies,
+        'items': sum(counts),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def summarize(raw):
+    """Turn raw worker output into the metrics we report and compare"""
+    latencies = raw['latencies']
+    total = sum(latencies)
+    return {
+        'runs': len(latencies),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p90_ms': percentile(latencies, 90) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'pages_per_s': len(latencies) / total if total else 0.0,
+        'items_per_s': raw['items'] / total if total else 0.0,
+        'items_per_page': raw['items'] / len(latencies),
+        'peak_rss_mb': raw['peak_rss_mb'],
+    }
+
+def print_results(results):
+    print(f"{'case':<48} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'pages/s':>9} {'items/s':>10} {'RSS MB':>8}")
+    print("-" * 106)
+    for case, m in results.items():
+        if 'error' in m:
+            print(f"{case:<48} ⚠️ skipped: {m['error']}")
+            continue
+        print(f"{case:<48} {m['p50_ms']:>9.1f} {m['p90_ms']:>9.1f} {m['p99_ms']:>9.1f} "
+              f"{m['pages_per_s']:>9.1f} {m['items_per_s']:>10.0f} {m['peak_rss_mb']:>8.1f}")
+
+def compare(results, baseline, tolerance):
+    """Return a list of human-readable regressions against the baseline"""
+    regressions = []
+    for case, m in results.items():
+        base = baseline.get(case)
+        if not base or 'error' in base:
+            continue
+        if 'error' in m:
+            regressions.append(f"{case}: now fails ({m['error']})")
+            continue
+
+        # Parsing is deterministic, so any drop in items means lost articles,
+        # however much faster the run got
+        if 'items_per_page' in base and m['items_per_page'] < base['items_per_page']:
+            regressions.append(f"{case}: items per page {m['items_per_page']:.1f} "
+                               f"(baseline {base['items_per_page']:.1f})")
+
+        limit = 1 + tolerance
+        checks = [
+            ('p50 latency', m['p50_ms'], base['p50_ms'] * limit, 'ms', True),
+            ('p90 latency', m['p90_ms'], base['p90_ms'] * limit, 'ms', True),
+            ('peak RSS', m['peak_rss_mb'], base['peak_rss_mb'] * limit, 'MB', True),
+            ('throughput', m['pages_per_s'], base['pages_per_s'] / limit, 'pages/s', False),
+        ]
+        for name, value, bound, unit, higher_is_worse in checks:
+            if (value > bound) if higher_is_worse else (value < bound):
+                regressions.append(f"{case}: {name} {value:.1f} {unit} "
+                                   f"(baseline allows {bound:.1f} {unit})")
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scrapers against local snapshots")
+    parser.add_argument('--source', action='append', choices=SOURCES,
+                        help="source to benchmark (repeatable, default: all in sources/)")
+    parser.add_argument('--mode', choices=MODES + ['all'], default='all',
+                        help="fetch with requests, headless Chrome, or both")
+    parser.add_argument('--runs', type=int, default=20, help="timed runs per case")
+    parser.add_argument('--items', type=int, default=2000,
+                        help="item count for the large synthetic pages")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="write results as the new baseline instead of comparing")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown/growth before a case counts as a regression")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    sources = args.source or SOURCES
+    modes = MODES if args.mode == 'all' else [args.mode]
+
+    print("=" * 60)
+    print("Offline Scraper Benchmarks")
+    print("=" * 60)
+
+    pages = build_pages(sources, args.items)
+    server, base_url = start_server(pages)
+    print(f"🌐 Serving {len(pages)} snapshots at {base_url}\n")
+
+    # Fresh process per case so peak RSS isn't shared between sources
+    ctx = multiprocessing.get_context('spawn')
+    results = {}
+    try:
+        for path in pages:
+            source = path.split('/')[1]
+            for mode in modes:
+                for unchanged in (False, True):
+                    case = f"{path.strip('/')}/{mode}" + ('/unchanged' if unchanged else '')
+                    print(f"⏱️  {case}...")
+                    with ctx.Pool(1) as pool:
+                        raw = pool.apply(run_case, (source, mode, base_url + path, args.runs, unchanged))
+                    results[case] = raw if 'error' in raw else summarize(raw)
+    finally:
+        server.shutdown()
+
+    print()
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n💾 Saved baseline to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"\n⚠️  No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) vs baseline:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+
+    print("\n✅ No regressions vs baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Listing-region fingerprints for browser-rendered sources
+Hashes the ordered item links of the rendered listing so a run can stop
+right after the page load when nothing changed since the last feed.
+Fingerprints are kept in state/fingerprints.json between runs.
+"""
+
+import hashlib
+import json
+import os
+
+FINGERPRINT_FILE = os.path.join('state', 'fingerprints.json')
+
+# Collect hrefs in-page so we don't pull the whole page source over the wire
+HREFS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]),
+                  a => a.getAttribute('href') || '');
+"""
+
+
+def fingerprint_hrefs(hrefs):
+    """Return a hash of an ordered list of hrefs, or None if it is empty"""
+    if not hrefs:
+        return None
+    return hashlib.sha256('\n'.join(hrefs).encode('utf-8')).hexdigest()
+
+
+def listing_fingerprint(driver, selector):
+    """Return a hash of the ordered hrefs matching selector in the rendered page"""
+    try:
+        hrefs = driver.execute_script(HREFS_SCRIPT, selector)
+    except Exception as e:
+        print(f"⚠️ Could not fingerprint listing: {e}")
+        return None
+
+    return fingerprint_hrefs(hrefs)
+
+
+def load_fingerprints(path=FINGERPRINT_FILE):
+    """Load saved fingerprints, keyed by source name"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_unchanged(source, fingerprint, output_file, path=FINGERPRINT_FILE):
+    """True if the listing matches the last run and its feed is still on disk"""
+    if not fingerprint or not os.path.exists(output_file):
+        return False
+    return load_fingerprints(path).get(source) == fingerprint
+
+
+def save_fingerprint(source, fingerprint, path=FINGERPRINT_FILE):
+    """Remember the listing fingerprint once its feed has been written"""
+    if not fingerprint:
+        return
+
+    fingerprints = load_fingerprints(path)
+    fingerprints[source] = fingerprint
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fingerprints, f, indent=2, sort_keys=True)
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Shared Scraping Engine
+Runs every source defined in sources/*.json through one fetch -> parse ->
+extract -> RSS pipeline. Specs are compiled once into soupsieve matchers,
+selector cascades and regexes, and browser sources share a single Chrome.
+
+Usage:
+    python scrape_engine.py              # run every source
+    python scrape_engine.py wire trump   # run selected sources
+"""
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from bs4 import BeautifulSoup
+from feedgen.feed import FeedGenerator
+from datetime import datetime, timezone
+from urllib.parse import urljoin
+from selector_cascade import SelectorStats, SelectorCascade
+from listing_fingerprint import (
+    fingerprint_hrefs, listing_fingerprint, is_unchanged, save_fingerprint
+)
+import requests
+import soupsieve as sv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+SOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sources')
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Fake browser headers to bypass basic bot detection
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+FETCH_TIERS = ('requests', 'browser')
+SOURCE_KEYS = {'name', 'url', 'base_url', 'fetch', 'headers', 'ready', 'wait',
+               'fingerprint', 'items', 'fields', 'filters', 'sort', 'limit',
+               'output', 'feed'}
+ITEM_KEYS = {'select', 'parent', 'limit'}
+FIELD_KEYS = {'name', 'rules', 'required', 'unique', 'default', 'same_as'}
+RULE_KEYS = {'from', 'select', 'attr', 'regex', 'remove', 'min_length',
+             'max_length', 'truncate', 'url', 'parse', 'formats'}
+FILTER_KEYS = {'field', 'when', 'reject'}
+FEED_KEYS = {'title', 'link', 'description', 'language'}
+
+
+class SourceSpecError(ValueError):
+    """Raised when a source definition is invalid"""
+
+
+def check_keys(where, spec, allowed):
+    """Reject unknown keys so typos in a spec fail loudly"""
+    unknown = set(spec) - allowed
+    if unknown:
+        raise SourceSpecError(f"{where}: unknown key(s) {', '.join(sorted(unknown))}")
+
+
+def parse_date(date_str, formats):
+    """Parse a date string with the first matching format, or None"""
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str.strip(), fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_iso(date_str):
+    """Parse an ISO 8601 timestamp, or None"""
+    try:
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class Rule:
+    """One way of getting a field value out of an item"""
+
+    def __init__(self, source, field, index, spec):
+        where = f"{source.name}.{field}.rules[{index}]"
+        check_keys(where, spec, RULE_KEYS)
+
+        self.base = spec.get('from', 'item')
+        if self.base not in ('item', 'parent'):
+            raise SourceSpecError(f"{where}: 'from' must be 'item' or 'parent'")
+        if self.base == 'parent' and not source.parent_tags:
+            raise SourceSpecError(f"{where}: 'from: parent' needs items.parent")
+
+        self.attr = spec.get('attr')
+        self.regex = re.compile(spec['regex']) if 'regex' in spec else None
+        self.remove = re.compile(spec['remove']) if 'remove' in spec else None
+        self.min_length = spec.get('min_length', 1)
+        self.max_length = spec.get('max_length')
+        self.truncate = spec.get('truncate')
+        self.base_url = source.base_url if spec.get('url') else None
+
+        self.parse = spec.get('parse')
+        self.formats = spec.get('formats', [])
+        if self.parse not in (None, 'date', 'iso'):
+            raise SourceSpecError(f"{where}: 'parse' must be 'date' or 'iso'")
+        if self.parse == 'date' and not self.formats:
+            raise SourceSpecError(f"{where}: 'parse: date' needs 'formats'")
+
+        # The first rule keeps the plain field name so stats read like "infowars.title"
+        selectors = spec.get('select')
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        self.cascade = None
+        if selectors:
+            stats_field = field if index == 0 else f"{field}.{index}"
+            self.cascade = SelectorCascade(source.stats, source.name, stats_field, selectors)
+
+    def apply(self, item, parent):
+        """Return this rule's value for an item, or None"""
+        base = parent if self.base == 'parent' else item
+        if self.cascade:
+            return self.cascade.first(base, self.extract)
+        return self.extract(base)
+
+    def extract(self, elem):
+        """Turn a matched element into a value, or None if it doesn't qualify"""
+        if self.attr:
+            value = elem.get(self.attr)
+            if isinstance(value, list):
+                value = ' '.join(value)
+        elif self.regex:
+            # Keep a space between text nodes so patterns like \s+ still match
+            # across <span>January</span> <span>17, 2025</span>
+            value = elem.get_text(' ', strip=True)
+        else:
+            value = elem.get_text(strip=True)
+        if not value:
+            return None
+
+        if self.regex:
+            match = self.regex.search(value)
+            if not match:
+                return None
+            value = match.group(0)
+
+        if self.remove:
+            value = self.remove.sub('', value).strip()
+
+        if len(value) < self.min_length:
+            return None
+        if self.max_length and len(value) > self.max_length:
+            return None
+        if self.truncate:
+            value = value[:self.truncate]
+
+        if self.base_url is not None:
+            value = urljoin(self.base_url, value)
+            if not value.startswith(('http://', 'https://')):
+                return None
+
+        if self.parse == 'date':
+            return parse_date(value, self.formats)
+        if self.parse == 'iso':
+            return parse_iso(value)
+        return value
+
+
+class Field:
+    """An output field: rules tried in order, then a default"""
+
+    def __init__(self, source, spec):
+        check_keys(f"{source.name}.fields", spec, FIELD_KEYS)
+        if 'name' not in spec:
+            raise SourceSpecError(f"{source.name}.fields: every field needs a 'name'")
+
+        self.name = spec['name']
+        self.rules = [Rule(source, self.name, i, rule)
+                      for i, rule in enumerate(spec.get('rules', []))]
+        self.same_as = spec.get('same_as')
+        self.default = spec.get('default')
+        if self.default not in (None, 'now'):
+            raise SourceSpecError(f"{source.name}.{self.name}: 'default' must be 'now'")
+        self.required = spec.get('required', self.default is None)
+        self.unique = spec.get('unique', False)
+
+        if not self.rules and self.same_as is None and self.default is None:
+            raise SourceSpecError(f"{source.name}.{self.name}: needs rules, same_as or default")
+
+    def value(self, item, parent, article):
+        """Return this field's value for an item, or None"""
+        if self.same_as is not None:
+            return article.get(self.same_as)
+
+        for rule in self.rules:
+            value = rule.apply(item, parent)
+            if value is not None:
+                return value
+
+        if self.default == 'now':
+            return datetime.now(timezone.utc)
+        return None
+
+    def cascades(self):
+        return [rule.cascade for rule in self.rules if rule.cascade]
+
+
+class Filter:
+    """Drops items whose field contains a rejected substring"""
+
+    def __init__(self, source, spec):
+        check_keys(f"{source.name}.filters", spec, FILTER_KEYS)
+        for key in ('field', 'reject'):
+            if key not in spec:
+                raise SourceSpecError(f"{source.name}.filters: every filter needs a '{key}'")
+        self.field = spec['field']
+        self.when = spec.get('when', '').lower()
+        self.reject = re.compile('|'.join(re.escape(p) for p in spec['reject']), re.IGNORECASE)
+
+    def rejects(self, value):
+        text = str(value)
+        if self.when and self.when not in text.lower():
+            return False
+        return bool(self.reject.search(text))
+
+
+class Source:
+    """A source spec compiled into matchers, ready to run"""
+
+    def __init__(self, spec, stats):
+        check_keys('source', spec, SOURCE_KEYS)
+        for key in ('name', 'url', 'fetch', 'items', 'fields', 'output', 'feed'):
+            if key not in spec:
+                raise SourceSpecError(f"{spec.get('name', 'source')}: missing '{key}'")
+
+        self.name = spec['name']
+        self.stats = stats
+        # Any edit to the spec must invalidate saved listing fingerprints
+        self.spec_hash = hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+        self.url = spec['url']
+        self.base_url = spec.get('base_url', self.url)
+        self.fetch = spec['fetch']
+        if self.fetch not in FETCH_TIERS:
+            raise SourceSpecError(f"{self.name}: 'fetch' must be one of {', '.join(FETCH_TIERS)}")
+        self.headers = {**DEFAULT_HEADERS, **spec.get('headers', {})}
+
+        # Browser readiness: wait for this selector, or just sleep `wait` seconds
+        self.ready = spec.get('ready')
+        self.wait = spec.get('wait', 5)
+
+        self.fingerprint = spec.get('fingerprint')
+        self.fingerprint_matcher = sv.compile(self.fingerprint) if self.fingerprint else None
+
+        items = spec['items']
+        check_keys(f"{self.name}.items", items, ITEM_KEYS)
+        self.items = sv.compile(items['select'])
+        self.parent_tags = items.get('parent')
+        self.item_limit = items.get('limit')
+
+        self.fields = [Field(self, field) for field in spec['fields']]
+        names = [field.name for field in self.fields]
+        for required in ('title', 'link'):
+            if required not in names:
+                raise SourceSpecError(f"{self.name}: needs a '{required}' field")
+        if 'date' not in names:
+            self.fields.append(Field(self, {'name': 'date', 'default': 'now'}))
+            names.append('date')
+
+        # same_as reads the article built so far, so it can only copy earlier fields
+        for i, field in enumerate(self.fields):
+            if field.same_as is not None and field.same_as not in names[:i]:
+                raise SourceSpecError(f"{self.name}.{field.name}: same_as '{field.same_as}' "
+                                      f"must name a field declared before it")
+
+        # Filters run as soon as their field is known, so rejects stop early
+        self.filters = {}
+        for filter_spec in spec.get('filters', []):
+            f = Filter(self, filter_spec)
+            if f.field not in names:
+                raise SourceSpecError(f"{self.name}.filters: unknown field '{f.field}'")
+            self.filters.setdefault(f.field, []).append(f)
+
+        self.sort = spec.get('sort')
+        if self.sort is not None and self.sort not in names:
+            raise SourceSpecError(f"{self.name}: sort by unknown field '{self.sort}'")
+        self.limit = spec.get('limit')
+        self.output = spec['output']
+
+        feed = spec['feed']
+        check_keys(f"{self.name}.feed", feed, FEED_KEYS)
+        self.feed = {'link': self.url, 'description': feed.get('title'), 'language': 'en', **feed}
+
+    def parse(self, html):
+        """Parse page HTML into articles"""
+        return self.extract(BeautifulSoup(html, 'html.parser'))
+
+    def extract(self, soup):
+        """Pull articles out of a parsed page"""
+        containers = self.items.select(soup, limit=self.item_limit or 0)
+        print(f"📊 Found {len(containers)} potential items")
+
+        articles = []
+        seen = {field.name: set() for field in self.fields if field.unique}
+
+        for item in containers:
+            parent = None
+            if self.parent_tags:
+                parent = item.find_parent(self.parent_tags)
+                if parent is None:
+                    continue
+
+            article = {}
+            for field in self.fields:
+                value = field.value(item, parent, article)
+                if value is None and field.required:
+                    break
+                # A missing optional value isn't a duplicate of another missing one
+                if field.unique and value is not None and value in seen[field.name]:
+                    break
+                if value is not None and any(f.rejects(value) for f in self.filters.get(field.name, [])):
+                    break
+                article[field.name] = value
+            else:
+                for name, values in seen.items():
+                    if article[name] is not None:
+                        values.add(article[name])
+                articles.append(article)
+                print(f"✓ {article['title'][:70]}")
+
+        if self.sort:
+            articles.sort(key=lambda a: a[self.sort], reverse=True)
+        if self.limit:
+            articles = articles[:self.limit]
+
+        print(f"📰 Found {len(articles)} unique articles")
+        return articles
+
+    def versioned(self, fingerprint):
+        """Tie a listing fingerprint to this exact spec"""
+        if not fingerprint:
+            return None
+        return hashlib.sha256(f'{self.spec_hash}:{fingerprint}'.encode('utf-8')).hexdigest()
+
+    def listing_hrefs(self, soup):
+        """Ordered hrefs of the listing region in a parsed page"""
+        return [a.get('href', '') for a in self.fingerprint_matcher.select(soup)]
+
+    def finish(self):
+        """Check every selector cascade for a layout change"""
+        for field in self.fields:
+            for cascade in field.cascades():
+                cascade.finish()
+
+
+def load_spec(path):
+    """Read one source definition"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_sources(names=None, stats=None, directory=SOURCES_DIR, errors=None):
+    """
+    Compile source definitions from directory, optionally only `names`.
+    By default the first bad spec raises; pass an `errors` list to collect
+    (name, exception) pairs instead and compile the rest.
+    """
+    stats = stats if stats is not None else SelectorStats()
+    available = sorted(f[:-5] for f in os.listdir(directory) if f.endswith('.json'))
+
+    for name in names or []:
+        if name not in available:
+            raise SourceSpecError(f"Unknown source '{name}' (have: {', '.join(available)})")
+
+    sources = []
+    for name in names or available:
+        try:
+            sources.append(Source(load_spec(os.path.join(directory, f'{name}.json')), stats))
+        except Exception as e:
+            if errors is None:
+                raise
+            errors.append((name, e))
+    return sources
+
+
+def setup_driver():
+    """Configure Chrome WebDriver with headless options"""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+
+    return webdriver.Chrome(options=chrome_options)
+
+
+def wait_until_ready(driver, source):
+    """Wait for the readiness selector, or a fixed delay when there isn't one"""
+    if not source.ready:
+        time.sleep(source.wait)
+        return
+
+    try:
+        WebDriverWait(driver, source.wait).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, source.ready))
+        )
+    except TimeoutException:
+        print(f"⚠️ '{source.ready}' not found after {source.wait}s, parsing anyway")
+
+
+def generate_rss(source, articles, output_file=None):
+    """Write articles to the source's RSS feed"""
+    output_file = output_file or source.output
+    print(f"📝 Generating RSS feed...")
+
+    fg = FeedGenerator()
+    fg.title(source.feed['title'])
+    fg.link(href=source.feed['link'], rel='alternate')
+    fg.description(source.feed['description'])
+    fg.language(source.feed['language'])
+
+    for article in articles:
+        fe = fg.add_entry()
+        fe.title(article['title'])
+        fe.link(href=article['link'])
+        fe.guid(article['link'], permalink=True)
+        fe.pubDate(article['date'])
+
+        if article.get('description'):
+            fe.description(article['description'])
+
+    fg.rss_file(output_file, pretty=True)
+    print(f"💾 Saved {len(articles)} articles to {output_file}")
+
+
+class Engine:
+    """Runs compiled sources, sharing one HTTP session and one browser"""
+
+    def __init__(self):
+        self.session = None
+        self.driver = None
+
+    def fetch_requests(self, source):
+        if self.session is None:
+            self.session = requests.Session()
+
+        response = self.session.get(source.url, headers=source.headers, timeout=15)
+        response.raise_for_status()
+        print(f"✅ Page loaded ({len(response.text)} bytes)")
+
+        soup = BeautifulSoup(response.text, 'html.parser')
+        fingerprint = None
+        if source.fingerprint:
+            fingerprint = source.versioned(fingerprint_hrefs(source.listing_hrefs(soup)))
+        return soup, fingerprint
+
+    def fetch_browser(self, source):
+        if self.driver is None:
+            print("🌐 Starting browser...")
+            self.driver = setup_driver()
+
+        self.driver.get(source.url)
+        print("⏳ Waiting for page to load...")
+        wait_until_ready(self.driver, source)
+
+        # Check before pulling page_source, which is the expensive part
+        fingerprint = None
+        if source.fingerprint:
+            fingerprint = source.versioned(listing_fingerprint(self.driver, source.fingerprint))
+            if is_unchanged(source.name, fingerprint, source.output):
+                return None, fingerprint
+
+        html = self.driver.page_source
+        print(f"✅ Page loaded ({len(html)} bytes)")
+        return BeautifulSoup(html, 'html.parser'), fingerprint
+
+    def run(self, source):
+        """Scrape one source and write its feed; returns True on success"""
+        print("=" * 60)
+        print(f"📰 {source.name}: {source.url}")
+        print("=" * 60)
+
+        try:
+            if source.fetch == 'browser':
+                soup, fingerprint = self.fetch_browser(source)
+            else:
+                soup, fingerprint = self.fetch_requests(source)
+
+            if soup is None or is_unchanged(source.name, fingerprint, source.output):
+                print(f"💤 Listing unchanged since last run, {source.output} is up to date")
+                return True
+
+            articles = source.extract(soup)
+            source.finish()
+            if not articles:
+                print(f"❌ No articles found for {source.name}. The site structure may have changed.")
+                return False
+
+            generate_rss(source, articles)
+            save_fingerprint(source.name, fingerprint)
+            print(f"✅ SUCCESS! Check {source.output}")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error scraping {source.name}: {e}")
+            return False
+
+    def close(self):
+        if self.driver is not None:
+            self.driver.quit()
+            print("🛑 Browser closed")
+        if self.session is not None:
+            self.session.close()
+
+
+def main(names=None):
+    """Run the named sources (default: all); returns True if all succeeded"""
+    stats = SelectorStats()
+    # A broken spec only takes down its own feed
+    errors = []
+    sources = load_sources(names, stats, errors=errors)
+    for name, e in errors:
+        print(f"❌ Skipping {name}: invalid source spec ({e})")
+
+    engine = Engine()
+    try:
+        results = [engine.run(source) for source in sources]
+    finally:
+        engine.close()
+        stats.save()
+
+    print(f"\n{sum(results)}/{len(results) + len(errors)} sources updated")
+    return all(results) and not errors
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(sys.argv[1:]) else 1)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Self-tuning selector cascades
+Tries an ordered list of CSS selectors, records which one wins for each
+source/field, and tries the usual winner first on the next run.
+Stats are kept in state/selector_stats.json so they survive between runs.
+"""
+
+import json
+import os
+
+import soupsieve as sv
+
+STATS_FILE = os.path.join('state', 'selector_stats.json')
+
+# A field's counts are halved together once it has seen this many lookups,
+# so old layouts fade out and the order keeps adapting
+DECAY_AT = 1000
+
+# Keep the declared order until a field has this many lookups of history
+MIN_LOOKUPS = 20
+
+# Rules answering at most this share of lookups count as dead and move last
+DEAD_SHARE = 0.01
+
+# Warn when the best rule wins less than this fraction of its usual share
+COLLAPSE_RATIO = 0.5
+
+
+class SelectorStats:
+    """
+    Lookup and win counts per source and field, persisted as JSON.
+    Each field stores {"lookups": n, "selectors": {selector: [tries, hits]}}.
+    A rule's share is hits / lookups: the fraction of all lookups of the field
+    it answered. Every rule shares that denominator, so a rule that only runs
+    after others miss is neither penalised for fewer tries nor inflated by a
+    high hit rate on leftovers.
+    """
+
+    def __init__(self, path=STATS_FILE):
+        self.path = path
+        self.data = {}
+        self.run = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    def entry(self, source, field):
+        """Return the stored entry for a field, creating it if needed"""
+        fields = self.data.setdefault(source, {})
+        entry = fields.get(field)
+        if not isinstance(entry, dict) or 'selectors' not in entry:
+            entry = fields[field] = {'lookups': 0, 'selectors': {}}
+        return entry
+
+    def counts(self, source, field, selector):
+        """Return the lifetime [tries, hits] list for a selector"""
+        return self.entry(source, field)['selectors'].setdefault(selector, [0, 0])
+
+    def lookup(self, source, field):
+        """Count one lookup of a field (lifetime and this run)"""
+        self.entry(source, field)['lookups'] += 1
+        run = self.run.setdefault((source, field), {'lookups': 0, 'selectors': {}})
+        run['lookups'] += 1
+
+    def record(self, source, field, selector, hit):
+        """Count one attempt of a selector (lifetime and this run)"""
+        run = self.run.setdefault((source, field), {'lookups': 0, 'selectors': {}})
+        for counts in (self.counts(source, field, selector),
+                       run['selectors'].setdefault(selector, [0, 0])):
+            counts[0] += 1
+            if hit:
+                counts[1] += 1
+
+    def order(self, source, field, selectors):
+        """
+        Move dead rules (share of lookups at most DEAD_SHARE) behind the live
+        ones, keeping declared order within each group. A rule only jumps ahead
+        of rules that practically never win, so which element gets picked
+        doesn't change; we just stop paying for misses.
+        """
+        entry = self.data.get(source, {}).get(field)
+        if not isinstance(entry, dict) or entry.get('lookups', 0) < MIN_LOOKUPS:
+            return list(selectors)
+
+        lookups = entry['lookups']
+        wins = entry.get('selectors', {})
+        dead = {sel for sel in selectors
+                if wins.get(sel, [0, 0])[1] / lookups <= DEAD_SHARE}
+        return ([sel for sel in selectors if sel not in dead] +
+                [sel for sel in selectors if sel in dead])
+
+    def check_collapse(self, source, field, selectors):
+        """Warn if the historically best selector stopped winning this run"""
+        entry = self.data.get(source, {}).get(field)
+        run = self.run.get((source, field))
+        if not isinstance(entry, dict) or not run or not run['lookups']:
+            return False
+
+        # Compare against history without this run mixed in
+        past_lookups = entry['lookups'] - run['lookups']
+        if past_lookups < MIN_LOOKUPS:
+            return False
+
+        best = self.order(source, field, selectors)[0]
+        hits = entry['selectors'].get(best, [0, 0])[1]
+        run_hits = run['selectors'].get(best, [0, 0])[1]
+
+        past_share = (hits - run_hits) / past_lookups
+        run_share = run_hits / run['lookups']
+        if run_share < past_share * COLLAPSE_RATIO:
+            print(f"⚠️ {source}.{field}: '{best}' hit rate dropped "
+                  f"{past_share:.0%} -> {run_share:.0%}, site layout may have changed")
+            return True
+        return False
+
+    def save(self):
+        """Decay old counts and write stats back to disk"""
+        for fields in self.data.values():
+            for entry in fields.values():
+                # Halve the whole field at once so relative ranks never change
+                if isinstance(entry, dict) and entry.get('lookups', 0) >= DECAY_AT:
+                    entry['lookups'] /= 2
+                    for counts in entry['selectors'].values():
+                        counts[0] /= 2
+                        counts[1] /= 2
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+
+
+class SelectorCascade:
+    """Ordered CSS selector fallbacks for one field of one source"""
+
+    def __init__(self, stats, source, field, selectors):
+        self.stats = stats
+        self.source = source
+        self.field = field
+        self.selectors = list(selectors)
+        self.ordered = stats.order(source, field, self.selectors)
+        # Compile once rather than looking the selector string up on every call
+        self.compiled = [(sel, sv.compile(sel)) for sel in self.ordered]
+
+    def first(self, element, extract=None):
+        """
+        Return the first value produced by a selector inside element.
+        extract(elem) turns a match into a value, or None to keep looking;
+        by default the match's stripped text is used.
+        """
+        if extract is None:
+            extract = lambda elem: elem.get_text(strip=True) or None
+
+        self.stats.lookup(self.source, self.field)
+        for selector, matcher in self.compiled:
+            elem = matcher.select_one(element)
+            value = extract(elem) if elem is not None else None
+            self.stats.record(self.source, self.field, selector, value is not None)
+            if value is not None:
+                return value
+        return None
+
+    def all(self, element):
+        """Return every match of the first selector that matches anything"""
+        self.stats.lookup(self.source, self.field)
+        for selector, matcher in self.compiled:
+            found = matcher.select(element)
+            self.stats.record(self.source, self.field, selector, bool(found))
+            if found:
+                return found
+        return []
+
+    def finish(self):
+        """Check for a layout change once the run is done"""
+        return self.stats.check_collapse(self.source, self.field, self.selectors)
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import run_benchmarks as rb
+
+BASE = {
+    'p50_ms': 10.0, 'p90_ms': 12.0, 'p99_ms': 15.0, 'pages_per_s': 100.0,
+    'items_per_s': 3000.0, 'items_per_page': 30.0, 'peak_rss_mb': 50.0, 'runs': 20,
+}
+
+
+def test_compare_passes_unchanged_case():
+    assert rb.compare({'wire/x/requests': dict(BASE)}, {'wire/x/requests': BASE}, 0.25) == []
+
+
+def test_compare_fails_when_baselined_case_now_errors():
+    results = {'wire/x/requests': {'error': 'ValueError: boom'}}
+    regressions = rb.compare(results, {'wire/x/requests': BASE}, 0.25)
+    assert len(regressions) == 1
+    assert 'now fails' in regressions[0]
+
+
+def test_compare_fails_on_fewer_items_even_if_faster():
+    faster_but_empty = dict(BASE, p50_ms=1.0, p90_ms=1.0, pages_per_s=1000.0, items_per_page=0.0)
+    regressions = rb.compare({'wire/x/requests': faster_but_empty}, {'wire/x/requests': BASE}, 0.25)
+    assert any('items per page' in r for r in regressions)
+
+
+def test_compare_flags_latency_regression():
+    slower = dict(BASE, p50_ms=20.0)
+    regressions = rb.compare({'wire/x/requests': slower}, {'wire/x/requests': BASE}, 0.25)
+    assert any('p50 latency' in r for r in regressions)
+
+
+def test_compare_ignores_cases_without_baseline():
+    assert rb.compare({'new/x/requests': {'error': 'boom'}}, {}, 0.25) == []
+
+
+def test_summarize_reports_items_per_page():
+    summary = rb.summarize({'latencies': [0.01, 0.02], 'items': 60, 'peak_rss_mb': 40.0})
+    assert summary['items_per_page'] == 30
+    assert summary['runs'] == 2
+
+
+def test_runs_below_one_is_rejected(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['run_benchmarks.py', '--runs', '0'])
+    with pytest.raises(SystemExit) as exc:
+        rb.main()
+    assert exc.value.code == 2
+
+
+def test_run_case_smoke():
+    server, base_url = rb.start_server({'/wire/synthetic-5': rb.synth_wire(5)})
+    try:
+        raw = rb.run_case('wire', 'requests', base_url + '/wire/synthetic-5', 1)
+        assert 'error' not in raw
+        assert raw['items'] > 0
+
+        unchanged = rb.run_case('wire', 'requests', base_url + '/wire/synthetic-5', 1, unchanged=True)
+        assert 'error' not in unchanged
+        assert unchanged['items'] == 0
+    finally:
+        server.shutdown()
@@ -0,0 +1,171 @@
+import pytest
+
+import scrape_engine
+from listing_fingerprint import (
+    fingerprint_hrefs, is_unchanged, listing_fingerprint, load_fingerprints, save_fingerprint
+)
+from scrape_engine import Engine, Source
+from selector_cascade import SelectorStats
+
+LISTING = '<a href="/news/one">First story title</a><a href="/news/two">Second story title</a>'
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, html):
+        self.html = html
+        self.gets = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.gets += 1
+        return FakeResponse(self.html)
+
+    def close(self):
+        pass
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for fetch_browser"""
+
+    def __init__(self, html, hrefs):
+        self.html = html
+        self.hrefs = hrefs
+        self.source_reads = 0
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, selector):
+        return list(self.hrefs)
+
+    @property
+    def page_source(self):
+        self.source_reads += 1
+        return self.html
+
+    def quit(self):
+        pass
+
+
+def make_source(tmp_path, fetch='requests'):
+    spec = {
+        'name': 'example',
+        'url': 'https://example.com/news',
+        'fetch': fetch,
+        'wait': 0,
+        'fingerprint': 'a[href]',
+        'items': {'select': 'a[href]'},
+        'fields': [
+            {'name': 'link', 'unique': True, 'rules': [{'attr': 'href', 'url': True}]},
+            {'name': 'title', 'rules': [{}]},
+        ],
+        'output': 'example_feed.xml',
+        'feed': {'title': 'Example'},
+    }
+    return Source(spec, SelectorStats(str(tmp_path / 'stats.json')))
+
+
+@pytest.fixture(autouse=True)
+def in_tmp(tmp_path, monkeypatch):
+    # Fingerprints and feeds are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def count_extracts(monkeypatch):
+    calls = []
+    real = Source.extract
+    monkeypatch.setattr(Source, 'extract', lambda self, soup: calls.append(1) or real(self, soup))
+    return calls
+
+
+def test_empty_listing_has_no_fingerprint():
+    assert fingerprint_hrefs([]) is None
+    assert not is_unchanged('example', fingerprint_hrefs([]), 'example_feed.xml')
+
+
+def test_fingerprint_depends_on_href_order():
+    assert fingerprint_hrefs(['/a', '/b']) != fingerprint_hrefs(['/b', '/a'])
+
+
+def test_is_unchanged_needs_the_feed_file(tmp_path):
+    fingerprint = fingerprint_hrefs(['/a'])
+    save_fingerprint('example', fingerprint)
+    assert not is_unchanged('example', fingerprint, 'example_feed.xml')
+
+    (tmp_path / 'example_feed.xml').write_text('<rss/>')
+    assert is_unchanged('example', fingerprint, 'example_feed.xml')
+    assert not is_unchanged('example', fingerprint_hrefs(['/b']), 'example_feed.xml')
+
+
+def test_listing_fingerprint_reads_hrefs_in_page():
+    driver = FakeDriver('', ['/a', '/b'])
+    assert listing_fingerprint(driver, 'a[href]') == fingerprint_hrefs(['/a', '/b'])
+
+
+def test_second_requests_run_skips_extraction(tmp_path, monkeypatch):
+    source = make_source(tmp_path)
+    engine = Engine()
+    engine.session = FakeSession(LISTING)
+    extracts = count_extracts(monkeypatch)
+
+    assert engine.run(source)
+    feed = (tmp_path / 'example_feed.xml').read_text()
+    assert extracts == [1]
+
+    assert engine.run(source)
+    assert extracts == [1]
+    assert (tmp_path / 'example_feed.xml').read_text() == feed
+
+
+def test_second_browser_run_skips_page_source_and_extraction(tmp_path, monkeypatch):
+    source = make_source(tmp_path, fetch='browser')
+    engine = Engine()
+    engine.driver = FakeDriver(LISTING, ['/news/one', '/news/two'])
+    extracts = count_extracts(monkeypatch)
+
+    assert engine.run(source)
+    feed = (tmp_path / 'example_feed.xml').read_text()
+    assert engine.driver.source_reads == 1
+
+    assert engine.run(source)
+    assert engine.driver.source_reads == 1
+    assert extracts == [1]
+    assert (tmp_path / 'example_feed.xml').read_text() == feed
+
+
+def test_changed_listing_is_rebuilt(tmp_path):
+    source = make_source(tmp_path)
+    engine = Engine()
+    engine.session = FakeSession(LISTING)
+    assert engine.run(source)
+
+    engine.session.html = LISTING + '<a href="/news/three">Third story title</a>'
+    assert engine.run(source)
+    assert 'news/three' in (tmp_path / 'example_feed.xml').read_text()
+
+
+def test_fingerprint_saved_only_after_feed_is_written(tmp_path, monkeypatch):
+    source = make_source(tmp_path)
+    engine = Engine()
+    engine.session = FakeSession(LISTING)
+
+    def broken_rss(source, articles, output_file=None):
+        raise OSError("disk full")
+    monkeypatch.setattr(scrape_engine, 'generate_rss', broken_rss)
+
+    assert not engine.run(source)
+    assert load_fingerprints() == {}
+
+    monkeypatch.undo()
+    monkeypatch.chdir(tmp_path)
+    extracts = count_extracts(monkeypatch)
+    assert engine.run(source)
+    assert extracts == [1]
+    assert 'example' in load_fingerprints()
@@ -0,0 +1,225 @@
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+import scrape_engine
+from scrape_engine import Source, SourceSpecError, load_sources
+from selector_cascade import SelectorStats
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'benchmarks', 'fixtures')
+
+# Expected values below were produced by the pre-engine parse_* functions
+# (parse_trump_news, parse_wire, parse_infowars, parse_whitehouse) on the same HTML.
+
+TRUMP_HTML = '''<html><body>
+<div class="card"><span>January</span> <span>17, 2025</span>
+  <a href="/news/president-trump-announces-new-plan">President Trump Announces New Plan</a></div>
+<div class="card"><p>December 22, 2024</p><h3>Holiday Message From The Campaign</h3>
+  <a href="https://www.donaldjtrump.com/news/holiday-message">Read</a></div>
+<div class="card"><a href="/news/president-trump-announces-new-plan">President Trump Announces New Plan</a></div>
+<div class="card"><a href="/about">About the campaign and the team</a></div>
+<div class="card"><a href="/news/rally-recap">Recent NewsRally Recap From Pennsylvania</a></div>
+</body></html>'''
+
+WIRE_HTML = '''<html><body>
+<nav><a href="/about/">About</a><a href="https://www.whitehouse.gov/issues/economy/">Economy and jobs across the nation today</a></nav>
+<a href="https://www.foxnews.com/politics/president-signs-historic-order">President signs historic order on trade and tariffs</a>
+<a href="https://www.breitbart.com/politics/story-two">President signs historic order on trade and tariffs</a>
+<a href="/articles/2025/01/white-house-article-on-the-economy/">White House article on the booming economy this week</a>
+<a href="https://www.dailywire.com/news/short">Too short</a>
+<a href="https://www.foxnews.com/politics/president-signs-historic-order">Duplicate URL with a different long title text here</a>
+</body></html>'''
+
+INFOWARS_HTML = '''<html><body>
+<article class="post"><h2><a href="/posts/first-story">First Story Headline</a></h2>
+  <time datetime="2025-01-15T12:00:00Z">January 15, 2025</time>
+  <p class="excerpt">This is the excerpt for the first story, long enough.</p></article>
+<article class="post"><a href="/posts/second-story">Second Story Link Title</a>
+  <span class="date">Jan 14, 2025</span><p>short</p></article>
+<article><h3>Third Story</h3><a href="https://www.infowars.com/posts/third-story">more</a>
+  <div class="published">2025-01-16</div></article>
+<article><h2>No link here</h2></article>
+</body></html>'''
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def stats(tmp_path):
+    return SelectorStats(str(tmp_path / 'stats.json'))
+
+
+def parse(name, html, stats):
+    return load_sources([name], stats)[0].parse(html)
+
+
+def test_trump_matches_pre_engine_parser(stats):
+    articles = parse('trump', TRUMP_HTML, stats)
+
+    assert [(a['title'], a['link']) for a in articles] == [
+        ('President Trump Announces New Plan',
+         'https://www.donaldjtrump.com/news/president-trump-announces-new-plan'),
+        ('Holiday Message From The Campaign',
+         'https://www.donaldjtrump.com/news/holiday-message'),
+        ('Rally Recap From Pennsylvania',
+         'https://www.donaldjtrump.com/news/rally-recap'),
+    ]
+    # The first date is split across <span>s; it must not fall back to now
+    assert articles[0]['date'] == utc(2025, 1, 17)
+    assert articles[1]['date'] == utc(2024, 12, 22)
+
+
+def test_wire_matches_pre_engine_parser(stats):
+    articles = parse('wire', WIRE_HTML, stats)
+
+    assert [(a['title'], a['link']) for a in articles] == [
+        ('President signs historic order on trade and tariffs',
+         'https://www.foxnews.com/politics/president-signs-historic-order'),
+        ('White House article on the booming economy this week',
+         'https://www.whitehouse.gov/articles/2025/01/white-house-article-on-the-economy/'),
+    ]
+
+
+def test_infowars_matches_pre_engine_parser(stats):
+    articles = parse('infowars', INFOWARS_HTML, stats)
+
+    # Sorted newest first, as generate_rss used to do
+    assert [(a['title'], a['link'], a['date'], a.get('description')) for a in articles] == [
+        ('Third Story', 'https://www.infowars.com/posts/third-story', utc(2025, 1, 16), None),
+        ('First Story Headline', 'https://www.infowars.com/posts/first-story', utc(2025, 1, 15),
+         'This is the excerpt for the first story, long enough.'),
+        ('Second Story Link Title', 'https://www.infowars.com/posts/second-story', utc(2025, 1, 14), None),
+    ]
+
+
+def test_whitehouse_matches_pre_engine_parser_on_recorded_page(stats):
+    with open(os.path.join(FIXTURE_DIR, 'whitehouse_news.html'), 'r', encoding='utf-8') as f:
+        articles = parse('whitehouse', f.read(), stats)
+
+    assert len(articles) == 10
+    assert articles[0]['title'] == ('New Milestone in Operation Metro Surge: 4,000+ '
+                                    'Criminal Illegals Removed from Minnesota Streets')
+    assert articles[0]['link'] == ('https://www.whitehouse.gov/articles/2026/02/new-milestone-in-'
+                                   'operation-metro-surge-4000-criminal-illegals-removed-from-minnesota-streets/')
+    assert articles[-1]['title'] == 'Ninth Meeting of the North American Drug Dialogue'
+    assert all(a['description'] == a['title'] for a in articles)
+    # The engine reads <time datetime> where the old scraper used the run time
+    assert articles[0]['date'].isoformat() == '2026-02-04T16:19:41-05:00'
+
+
+# ---------------------------------------------------------------------------
+# Spec validation
+# ---------------------------------------------------------------------------
+
+def minimal_spec(**overrides):
+    spec = {
+        'name': 'example',
+        'url': 'https://example.com/news',
+        'fetch': 'requests',
+        'items': {'select': 'a[href]'},
+        'fields': [
+            {'name': 'link', 'rules': [{'attr': 'href', 'url': True}]},
+            {'name': 'title', 'rules': [{}]},
+        ],
+        'output': 'example_feed.xml',
+        'feed': {'title': 'Example'},
+    }
+    spec.update(overrides)
+    return spec
+
+
+def test_minimal_spec_compiles(stats):
+    source = Source(minimal_spec(), stats)
+    articles = source.parse('<a href="/one">One</a><a href="mailto:x@example.com">Mail</a>')
+    assert [a['link'] for a in articles] == ['https://example.com/one']
+
+
+def test_missing_optional_unique_values_are_not_duplicates(stats):
+    source = Source(minimal_spec(fields=[
+        {'name': 'link', 'rules': [{'attr': 'href', 'url': True}]},
+        {'name': 'title', 'rules': [{}]},
+        {'name': 'description', 'rules': [{'attr': 'title'}], 'required': False, 'unique': True},
+    ]), stats)
+    articles = source.parse('<a href="/one">One</a><a href="/two">Two</a>'
+                            '<a href="/three" title="Same">Three</a><a href="/four" title="Same">Four</a>')
+    assert [a['title'] for a in articles] == ['One', 'Two', 'Three']
+
+
+@pytest.mark.parametrize('spec, message', [
+    (minimal_spec(colour='red'), 'unknown key'),
+    ({k: v for k, v in minimal_spec().items() if k != 'output'}, "missing 'output'"),
+    (minimal_spec(fetch='ftp'), "'fetch' must be one of"),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href'}]}]), "needs a 'title' field"),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href'}]},
+                          {'name': 'title', 'rules': [{'from': 'parent'}]}]), "needs items.parent"),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href'}]},
+                          {'name': 'title', 'rules': [{'parse': 'date'}]}]), "needs 'formats'"),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href', 'selct': 'a'}]},
+                          {'name': 'title', 'rules': [{}]}]), 'unknown key'),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href'}]},
+                          {'name': 'title', 'default': 'yesterday'}]), "'default' must be 'now'"),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href'}]},
+                          {'name': 'title'}]), 'needs rules, same_as or default'),
+    (minimal_spec(filters=[{'field': 'summary', 'reject': ['x']}]), "unknown field 'summary'"),
+    (minimal_spec(filters=[{'reject': ['x']}]), "needs a 'field'"),
+    (minimal_spec(filters=[{'field': 'link'}]), "needs a 'reject'"),
+    (minimal_spec(sort='published'), "sort by unknown field 'published'"),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href'}]},
+                          {'name': 'title', 'rules': [{}]},
+                          {'name': 'description', 'same_as': 'summary'}]), 'declared before it'),
+    (minimal_spec(fields=[{'name': 'link', 'rules': [{'attr': 'href'}]},
+                          {'name': 'description', 'same_as': 'title'},
+                          {'name': 'title', 'rules': [{}]}]), 'declared before it'),
+])
+def test_invalid_specs_raise(stats, spec, message):
+    with pytest.raises(SourceSpecError, match=message):
+        Source(spec, stats)
+
+
+def test_unknown_source_name_raises(stats):
+    with pytest.raises(SourceSpecError, match="Unknown source"):
+        load_sources(['nope'], stats)
+
+
+def test_bad_spec_files_are_collected_not_fatal(tmp_path, stats):
+    (tmp_path / 'good.json').write_text(json.dumps(minimal_spec(name='good')))
+    (tmp_path / 'broken.json').write_text('{ not json')
+    (tmp_path / 'invalid.json').write_text(json.dumps(minimal_spec(name='invalid', fetch='ftp')))
+
+    with pytest.raises(ValueError):
+        load_sources(stats=stats, directory=str(tmp_path))
+
+    errors = []
+    sources = load_sources(stats=stats, directory=str(tmp_path), errors=errors)
+    assert [s.name for s in sources] == ['good']
+    assert sorted(name for name, _ in errors) == ['broken', 'invalid']
+
+
+def test_main_runs_valid_sources_when_one_spec_is_broken(tmp_path, monkeypatch):
+    (tmp_path / 'good.json').write_text(json.dumps(minimal_spec(name='good')))
+    (tmp_path / 'broken.json').write_text('{ not json')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scrape_engine, 'SOURCES_DIR', str(tmp_path))
+    # load_sources binds the directory default at import time
+    real_load = scrape_engine.load_sources
+    monkeypatch.setattr(scrape_engine, 'load_sources',
+                        lambda names, stats, errors: real_load(names, stats, str(tmp_path), errors))
+
+    ran = []
+    monkeypatch.setattr(scrape_engine.Engine, 'run', lambda self, source: ran.append(source.name) or True)
+
+    assert scrape_engine.main() is False
+    assert ran == ['good']
+
+
+def test_spec_edits_change_the_fingerprint(stats):
+    before = Source(minimal_spec(), stats)
+    after = Source(minimal_spec(limit=10), stats)
+    assert before.versioned('abc') == Source(minimal_spec(), stats).versioned('abc')
+    assert before.versioned('abc') != after.versioned('abc')
+    assert before.versioned(None) is None
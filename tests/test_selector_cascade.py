@@ -0,0 +1,94 @@
+from bs4 import BeautifulSoup
+
+from selector_cascade import SelectorStats, SelectorCascade, DECAY_AT, MIN_LOOKUPS
+
+TITLE_SELECTORS = ['h2', 'h3', 'h1', '.title', '[class*="title"]', 'a']
+
+
+def make_stats(tmp_path, lookups, selectors):
+    stats = SelectorStats(str(tmp_path / 'stats.json'))
+    stats.data = {'infowars': {'title': {'lookups': lookups, 'selectors': selectors}}}
+    return stats
+
+
+def test_order_keeps_declared_order_without_history(tmp_path):
+    stats = make_stats(tmp_path, MIN_LOOKUPS - 1, {'a': [5, 5]})
+    assert stats.order('infowars', 'title', TITLE_SELECTORS) == TITLE_SELECTORS
+
+
+def test_order_moves_dead_rules_last(tmp_path):
+    stats = make_stats(tmp_path, 100, {'h2': [100, 0], 'h3': [100, 80], 'a': [20, 20]})
+    assert stats.order('infowars', 'title', TITLE_SELECTORS) == \
+        ['h3', 'a', 'h2', 'h1', '.title', '[class*="title"]']
+
+
+def test_order_never_puts_a_live_rule_ahead_of_an_earlier_live_rule(tmp_path):
+    stats = make_stats(tmp_path, 100, {'h2': [100, 40], 'a': [60, 60]})
+    order = stats.order('infowars', 'title', TITLE_SELECTORS)
+    assert order.index('h2') < order.index('a')
+
+    html = '<article><a href="/cat/news">NEWS</a><h2>Real headline</h2></article>'
+    article = BeautifulSoup(html, 'html.parser').article
+    cascade = SelectorCascade(stats, 'infowars', 'title', TITLE_SELECTORS)
+    assert cascade.first(article) == 'Real headline'
+
+
+def test_catch_all_fallback_does_not_overtake_on_conditional_hit_rate(tmp_path):
+    # 'a' only runs when h2 misses, so it hits 100% of its tries but wins fewer lookups
+    stats = make_stats(tmp_path, 999, {'h2': [999, 600], 'a': [400, 400]})
+    assert stats.order('infowars', 'title', TITLE_SELECTORS)[0] == 'h2'
+
+
+def test_decay_halves_whole_field_and_keeps_order(tmp_path):
+    stats = make_stats(tmp_path, 999, {'h2': [999, 600], 'a': [399, 399]})
+    html = '<article><a href="/category/news">NEWS</a><h2>Real headline here</h2></article>'
+    article = BeautifulSoup(html, 'html.parser').article
+
+    cascade = SelectorCascade(stats, 'infowars', 'title', TITLE_SELECTORS)
+    assert cascade.first(article) == 'Real headline here'
+    stats.save()
+
+    entry = SelectorStats(stats.path).data['infowars']['title']
+    assert entry['lookups'] == 500
+    assert entry['selectors']['h2'] == [500, 300.5]
+    assert entry['selectors']['a'] == [199.5, 199.5]
+
+    reloaded = SelectorStats(stats.path)
+    assert reloaded.order('infowars', 'title', TITLE_SELECTORS)[0] == 'h2'
+    cascade = SelectorCascade(reloaded, 'infowars', 'title', TITLE_SELECTORS)
+    assert cascade.first(article) == 'Real headline here'
+
+
+def test_no_decay_below_limit(tmp_path):
+    stats = make_stats(tmp_path, DECAY_AT - 1, {'h2': [DECAY_AT - 1, 10]})
+    stats.save()
+    assert SelectorStats(stats.path).data['infowars']['title']['lookups'] == DECAY_AT - 1
+
+
+def test_check_collapse_warns_when_best_rule_stops_winning(tmp_path, capsys):
+    stats = make_stats(tmp_path, 100, {'h2': [100, 90], 'a': [10, 10]})
+    cascade = SelectorCascade(stats, 'infowars', 'title', TITLE_SELECTORS)
+    soup = BeautifulSoup('<article><a href="/x">Only a link</a></article>', 'html.parser')
+    for _ in range(10):
+        cascade.first(soup.article)
+
+    assert cascade.finish()
+    assert "site layout may have changed" in capsys.readouterr().out
+
+
+def test_check_collapse_quiet_when_best_rule_still_wins(tmp_path):
+    stats = make_stats(tmp_path, 100, {'h2': [100, 90]})
+    cascade = SelectorCascade(stats, 'infowars', 'title', TITLE_SELECTORS)
+    soup = BeautifulSoup('<article><h2>Headline</h2></article>', 'html.parser')
+    for _ in range(10):
+        cascade.first(soup.article)
+
+    assert not cascade.finish()
+
+
+def test_check_collapse_needs_history(tmp_path):
+    stats = make_stats(tmp_path, 0, {})
+    cascade = SelectorCascade(stats, 'infowars', 'title', TITLE_SELECTORS)
+    soup = BeautifulSoup('<article><a href="/x">Only a link</a></article>', 'html.parser')
+    cascade.first(soup.article)
+    assert not cascade.finish()